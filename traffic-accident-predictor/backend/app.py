@@ -1,5 +1,6 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
 from joblib import load
 import torch
 import numpy as np
@@ -12,6 +13,8 @@ import io
 import base64
 import re
 import math
+import threading
+import time
 
 #  Flask app
 app = Flask(__name__)
@@ -35,12 +38,377 @@ load_dotenv()
 app.config['OPENWEATHERMAP_KEY'] = os.getenv('OPENWEATHERMAP_KEY', '8407cb6677f41d255f58a5d6789b601e')
 app.config['TOMTOM_KEY'] = os.getenv('TOMTOM_KEY', 'VLY170Ef4AqkV1nn8e6ffqFt0aXPwMq0')
 
+# Admission control for /api/predict. A prediction is ~25ms of GIL-bound model
+# work, so one process saturates at a handful of requests; see load_test.py
+app.config['PREDICT_MAX_IN_FLIGHT'] = int(os.getenv('PREDICT_MAX_IN_FLIGHT', '4'))
+app.config['PREDICT_DEGRADE_THRESHOLD'] = int(os.getenv('PREDICT_DEGRADE_THRESHOLD', '2'))
+app.config['PREDICT_RETRY_AFTER'] = int(os.getenv('PREDICT_RETRY_AFTER', '1'))
+
+# Fleet telemetry index
+app.config['TELEMETRY_GEOHASH_PRECISION'] = int(os.getenv('TELEMETRY_GEOHASH_PRECISION', '6'))
+app.config['TELEMETRY_BUFFER_SIZE'] = int(os.getenv('TELEMETRY_BUFFER_SIZE', '256'))
+app.config['TELEMETRY_MAX_AGE'] = float(os.getenv('TELEMETRY_MAX_AGE', '300'))
+app.config['TELEMETRY_MIN_SAMPLES'] = int(os.getenv('TELEMETRY_MIN_SAMPLES', '5'))
+# Bounds on index memory (~1.6KB per cell) and on how long one ingest holds
+# telemetry_lock, which /api/predict lookups wait on; see telemetry_bench.py
+app.config['TELEMETRY_MAX_CELLS'] = int(os.getenv('TELEMETRY_MAX_CELLS', '50000'))
+app.config['TELEMETRY_MAX_BATCH'] = int(os.getenv('TELEMETRY_MAX_BATCH', '5000'))
+app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_CONTENT_LENGTH', str(1024 * 1024)))
+# Free-flow speed baseline per cell, kept across ring windows
+app.config['TELEMETRY_BASELINE_HALF_LIFE'] = float(os.getenv('TELEMETRY_BASELINE_HALF_LIFE', '3600'))
+app.config['TELEMETRY_BASELINE_MIN_HISTORY'] = float(os.getenv('TELEMETRY_BASELINE_MIN_HISTORY', '1800'))
+
+# Cell ids pack 5 bits per geohash character into an int64
+if not 1 <= app.config['TELEMETRY_GEOHASH_PRECISION'] <= 12:
+    raise ValueError("TELEMETRY_GEOHASH_PRECISION must be between 1 and 12")
+# Per-cell histogram counts are uint16
+if not 1 <= app.config['TELEMETRY_BUFFER_SIZE'] <= 65535:
+    raise ValueError("TELEMETRY_BUFFER_SIZE must be between 1 and 65535")
+# A batch must always fit in the index, even when every reading is a new cell
+if not 1 <= app.config['TELEMETRY_MAX_BATCH'] <= app.config['TELEMETRY_MAX_CELLS']:
+    raise ValueError("TELEMETRY_MAX_BATCH must be between 1 and TELEMETRY_MAX_CELLS")
+
 # Initialize models as a global variable
 models = None
 
 # Add after models initialization
 safety_advice_templates = None
 
+# In-flight prediction requests and shedding/degradation counters
+load_lock = threading.Lock()
+load_stats = {
+    "in_flight": 0,
+    "peak_in_flight": 0,
+    "admitted": 0,
+    "shed": 0,
+    "degraded": 0
+}
+
+def admit_request():
+    """Reserve a prediction slot.
+
+    Returns None if the request must be shed, otherwise whether it should
+    be served in degraded mode.
+    """
+    with load_lock:
+        if load_stats["in_flight"] >= app.config['PREDICT_MAX_IN_FLIGHT']:
+            load_stats["shed"] += 1
+            return None
+        load_stats["in_flight"] += 1
+        load_stats["admitted"] += 1
+        load_stats["peak_in_flight"] = max(load_stats["peak_in_flight"], load_stats["in_flight"])
+        return load_stats["in_flight"] > app.config['PREDICT_DEGRADE_THRESHOLD']
+
+def release_request():
+    with load_lock:
+        load_stats["in_flight"] -= 1
+
+def get_load_stats():
+    with load_lock:
+        stats = dict(load_stats)
+    stats["max_in_flight"] = app.config['PREDICT_MAX_IN_FLIGHT']
+    stats["degrade_threshold"] = app.config['PREDICT_DEGRADE_THRESHOLD']
+    return stats
+
+# Fleet telemetry: speed readings bucketed by geohash cell
+GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+MAX_TELEMETRY_SPEED = 250.0  # km/h; faster readings are clipped to this
+SPEED_BIN_COUNT = 250  # 1 km/h histogram bins, the last one closed at 250
+
+def encode_geohash_cells(lats, lons, precision):
+    """Vectorised geohash encoding returning integer cell ids.
+
+    The id holds the interleaved geohash bits, so it maps one-to-one onto
+    the base32 geohash string without building strings for every reading.
+    """
+    total_bits = precision * 5
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    lon_idx = np.clip(((lons + 180.0) / 360.0 * (1 << lon_bits)).astype(np.int64), 0, (1 << lon_bits) - 1)
+    lat_idx = np.clip(((lats + 90.0) / 180.0 * (1 << lat_bits)).astype(np.int64), 0, (1 << lat_bits) - 1)
+
+    # Geohash interleaves bits starting with longitude
+    cells = np.zeros(len(lats), dtype=np.int64)
+    for i in range(total_bits):
+        if i % 2 == 0:
+            bit = (lon_idx >> (lon_bits - 1 - i // 2)) & 1
+        else:
+            bit = (lat_idx >> (lat_bits - 1 - i // 2)) & 1
+        cells = (cells << 1) | bit
+    return cells
+
+def geohash_from_cell(cell, precision):
+    chars = []
+    for i in range(precision):
+        chars.append(GEOHASH_BASE32[(cell >> (5 * (precision - 1 - i))) & 31])
+    return "".join(chars)
+
+class TelemetryIndex:
+    """Fixed-size speed ring buffers for every geohash cell, one row per cell.
+
+    Each row keeps a running sum and a speed histogram that are updated as
+    readings enter and leave its ring, so the mean, a percentile or the
+    count of a cell is read without scanning the ring. A batch updates all
+    of its cells with a few array operations instead of one call per cell.
+    Cells not updated within max_age are dropped on ingest and their rows
+    reused. Once max_cells rows are in use, the least recently updated cells
+    make room for new ones.
+
+    Free-flow speed comes from a separate per-cell baseline: the window's
+    85th percentile, sampled once it holds min_samples readings and then at
+    most every baseline_half_life / 60 seconds, and folded into a maximum that halves every baseline_half_life seconds. A jam that fills the whole window
+    therefore still reads as slow against the speeds seen before it.
+    """
+
+    def __init__(self, size, max_age, min_samples, max_cells, baseline_half_life,
+                 baseline_min_history, capacity=1024):
+        self.size = size
+        self.max_age = max_age
+        self.min_samples = min_samples
+        self.max_cells = max_cells
+        self.baseline_half_life = baseline_half_life
+        self.baseline_min_history = baseline_min_history
+        self.rows = {}  # cell id -> row
+        self.free_rows = []
+        self.capacity = 0
+        self.last_sweep = 0.0
+        self.row_cells = np.zeros(0, dtype=np.int64)
+        self.speeds = np.zeros((0, size), dtype=np.float32)
+        self.histogram = np.zeros((0, SPEED_BIN_COUNT), dtype=np.uint16)
+        self.head = np.zeros(0, dtype=np.int64)
+        self.count = np.zeros(0, dtype=np.int64)
+        self.total = np.zeros(0, dtype=float)
+        self.last_update = np.zeros(0, dtype=float)
+        self.first_seen = np.zeros(0, dtype=float)
+        self.free_flow = np.zeros(0, dtype=float)
+        self.baseline_update = np.zeros(0, dtype=float)
+        self._grow(min(capacity, max_cells))
+
+    def _grow(self, capacity):
+        extra = capacity - self.capacity
+        self.row_cells = np.concatenate([self.row_cells, np.full(extra, -1, dtype=np.int64)])
+        self.speeds = np.concatenate([self.speeds, np.zeros((extra, self.size), dtype=np.float32)])
+        self.histogram = np.concatenate([self.histogram, np.zeros((extra, SPEED_BIN_COUNT), dtype=np.uint16)])
+        self.head = np.concatenate([self.head, np.zeros(extra, dtype=np.int64)])
+        self.count = np.concatenate([self.count, np.zeros(extra, dtype=np.int64)])
+        self.total = np.concatenate([self.total, np.zeros(extra, dtype=float)])
+        self.last_update = np.concatenate([self.last_update, np.zeros(extra, dtype=float)])
+        self.first_seen = np.concatenate([self.first_seen, np.zeros(extra, dtype=float)])
+        self.free_flow = np.concatenate([self.free_flow, np.zeros(extra, dtype=float)])
+        self.baseline_update = np.concatenate([self.baseline_update, np.zeros(extra, dtype=float)])
+        self.free_rows.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def _rows_for(self, cells, now):
+        """Return the row of every cell, allocating rows for new ones.
+
+        Returns a tuple of (rows, number of cells evicted to make room).
+        """
+        if len(cells) > self.max_cells:
+            raise ValueError(f"batch covers {len(cells)} cells, more than the limit of {self.max_cells}")
+        get = self.rows.get
+        rows = np.fromiter((get(cell, -1) for cell in cells.tolist()), dtype=np.int64, count=len(cells))
+        missing = np.flatnonzero(rows < 0)
+        evicted_cells = 0
+        if len(missing):
+            shortfall = len(missing) - len(self.free_rows)
+            if shortfall > 0 and self.capacity < self.max_cells:
+                self._grow(min(self.max_cells, max(2 * self.capacity, self.capacity + shortfall)))
+                shortfall = len(missing) - len(self.free_rows)
+            if shortfall > 0:
+                evicted_cells = self._evict_oldest(shortfall, rows[rows >= 0])
+            new_rows = self.free_rows[-len(missing):]
+            del self.free_rows[-len(missing):]
+            rows[missing] = new_rows
+            self.row_cells[new_rows] = cells[missing]
+            self.first_seen[new_rows] = now
+            self.rows.update(zip(cells[missing].tolist(), new_rows))
+        return rows, evicted_cells
+
+    def _release(self, rows):
+        for cell in self.row_cells[rows].tolist():
+            del self.rows[cell]
+        self.row_cells[rows] = -1
+        self.histogram[rows] = 0
+        self.head[rows] = 0
+        self.count[rows] = 0
+        self.total[rows] = 0.0
+        self.free_flow[rows] = 0.0
+        self.baseline_update[rows] = 0.0
+        self.free_rows.extend(rows.tolist())
+        return len(rows)
+
+    def _evict_oldest(self, n, keep):
+        """Release the n least recently updated rows, sparing those in keep."""
+        candidates = self.row_cells >= 0
+        candidates[keep] = False
+        candidates = np.flatnonzero(candidates)
+        oldest = np.argpartition(self.last_update[candidates], n - 1)[:n]
+        return self._release(candidates[oldest])
+
+    def evict_stale(self, now):
+        stale = np.flatnonzero((self.row_cells >= 0) & (self.last_update < now - self.max_age))
+        return self._release(stale)
+
+    def ingest(self, cells, speeds, now):
+        """Append speeds to the rings of their cells, in arrival order.
+
+        Returns the number of cells dropped, stale or to make room.
+        """
+        evicted_cells = 0
+        if now - self.last_sweep >= self.max_age / 10:
+            evicted_cells = self.evict_stale(now)
+            self.last_sweep = now
+        if not len(cells):
+            return evicted_cells
+
+        # Group readings by cell, keeping their arrival order within each cell
+        order = np.argsort(cells, kind='stable')
+        speeds = speeds[order].astype(np.float32)
+        unique_cells, starts, counts = np.unique(cells[order], return_index=True, return_counts=True)
+        rows, displaced_cells = self._rows_for(unique_cells, now)
+        evicted_cells += displaced_cells
+
+        # A cell only keeps the latest `size` readings of one batch
+        group = np.repeat(np.arange(len(unique_cells)), counts)
+        skip = np.maximum(counts - self.size, 0)
+        rank = np.arange(len(speeds)) - starts[group] - skip[group]
+        keep = rank >= 0
+        group, rank, speeds = group[keep], rank[keep], speeds[keep]
+        kept = counts - skip
+
+        reading_rows = rows[group]
+        slots = (self.head[reading_rows] + rank) % self.size
+
+        # Remove readings that are about to be overwritten
+        filled = slots < self.count[reading_rows]
+        evicted = self.speeds[reading_rows[filled], slots[filled]]
+        self.total[rows] -= np.bincount(group[filled], weights=evicted, minlength=len(rows))
+        np.subtract.at(self.histogram, (reading_rows[filled], speed_bins(evicted)), 1)
+
+        self.speeds[reading_rows, slots] = speeds
+        self.total[rows] += np.bincount(group, weights=speeds, minlength=len(rows))
+        np.add.at(self.histogram, (reading_rows, speed_bins(speeds)), 1)
+        self.head[rows] = (self.head[rows] + kept) % self.size
+        self.count[rows] = np.minimum(self.count[rows] + kept, self.size)
+        self.last_update[rows] = now
+
+        due = rows[(self.count[rows] >= self.min_samples) &
+                   (now - self.baseline_update[rows] >= self.baseline_half_life / 60)]
+        decay = 0.5 ** ((now - self.baseline_update[due]) / self.baseline_half_life)
+        self.free_flow[due] = np.maximum(self.percentiles(due, 85), self.free_flow[due] * decay)
+        self.baseline_update[due] = now
+        return evicted_cells
+
+    def lookup(self, cell, now):
+        """Return (mean, free-flow speed, count) for a cell with fresh data.
+
+        Returns None if the cell has no fresh data. The free-flow speed is
+        None until the cell has baseline_min_history seconds of history.
+        """
+        row = self.rows.get(cell)
+        if row is None or self.count[row] < self.min_samples:
+            return None
+        if now - self.last_update[row] > self.max_age:
+            return None
+        count = int(self.count[row])
+        free_flow = None
+        if now - self.first_seen[row] >= self.baseline_min_history:
+            free_flow = float(self.free_flow[row])
+        return self.total[row] / count, free_flow, count
+
+    def percentiles(self, rows, q):
+        ranks = np.maximum(1, np.ceil(q / 100.0 * self.count[rows]))
+        cumulative = np.cumsum(self.histogram[rows], axis=1, dtype=np.int32)
+        # Bin midpoint, so the estimate is within 0.5 km/h either way
+        return (cumulative < ranks[:, None]).sum(axis=1) + 0.5
+
+    def percentile(self, row, q):
+        return float(self.percentiles(np.array([row]), q)[0])
+
+def speed_bins(speeds):
+    return np.minimum(speeds, SPEED_BIN_COUNT - 1).astype(np.int64)
+
+def create_telemetry_index():
+    return TelemetryIndex(app.config['TELEMETRY_BUFFER_SIZE'], app.config['TELEMETRY_MAX_AGE'],
+                          app.config['TELEMETRY_MIN_SAMPLES'], app.config['TELEMETRY_MAX_CELLS'],
+                          app.config['TELEMETRY_BASELINE_HALF_LIFE'],
+                          app.config['TELEMETRY_BASELINE_MIN_HISTORY'])
+
+telemetry_lock = threading.Lock()
+telemetry_index = create_telemetry_index()
+telemetry_stats = {
+    "readings_ingested": 0,
+    "readings_rejected": 0,
+    "batches": 0,
+    "cells_evicted": 0
+}
+
+def ingest_telemetry(lats, lons, speeds):
+    """Add a batch of speed readings to the per-cell ring buffers.
+
+    Returns a tuple of (accepted, rejected) reading counts.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    speeds = np.asarray(speeds, dtype=float)
+    if not (len(lats) == len(lons) == len(speeds)):
+        raise ValueError("latitude, longitude and speed must have the same length")
+
+    valid = (np.isfinite(lats) & np.isfinite(lons) & np.isfinite(speeds) &
+             (lats >= -90) & (lats <= 90) & (lons >= -180) & (lons <= 180) &
+             (speeds >= 0))
+    rejected = int(len(speeds) - valid.sum())
+    lats, lons = lats[valid], lons[valid]
+    # Clip before both the running sum and the histogram so mean and
+    # percentiles describe the same values
+    speeds = np.minimum(speeds[valid], MAX_TELEMETRY_SPEED)
+
+    cells = encode_geohash_cells(lats, lons, app.config['TELEMETRY_GEOHASH_PRECISION'])
+    with telemetry_lock:
+        evicted_cells = telemetry_index.ingest(cells, speeds, time.time())
+        telemetry_stats["readings_ingested"] += len(speeds)
+        telemetry_stats["readings_rejected"] += rejected
+        telemetry_stats["batches"] += 1
+        telemetry_stats["cells_evicted"] += evicted_cells
+    return len(speeds), rejected
+
+def get_telemetry_traffic(lat, lon):
+    """Traffic features for the cell containing (lat, lon), or None if stale.
+
+    congestion_percentage is None while the cell's free-flow baseline is
+    still too short to compare against.
+    """
+    precision = app.config['TELEMETRY_GEOHASH_PRECISION']
+    cell = int(encode_geohash_cells(np.array([lat]), np.array([lon]), precision)[0])
+    with telemetry_lock:
+        features = telemetry_index.lookup(cell, time.time())
+    if features is None:
+        return None
+    flow_speed, free_flow_speed, sample_count = features
+
+    congestion_percentage = None
+    if free_flow_speed is not None:
+        congestion_percentage = 0.0
+        if free_flow_speed > 0:
+            congestion_percentage = max(0.0, min(100.0, (1 - flow_speed / free_flow_speed) * 100))
+        free_flow_speed = round(free_flow_speed, 1)
+        congestion_percentage = round(congestion_percentage, 1)
+    return {
+        "flow_speed": round(flow_speed, 1),
+        "free_flow_speed": free_flow_speed,
+        "congestion_percentage": congestion_percentage,
+        "sample_count": sample_count,
+        "geohash": geohash_from_cell(cell, precision),
+        "source": "telemetry"
+    }
+
+def get_telemetry_stats():
+    with telemetry_lock:
+        stats = dict(telemetry_stats)
+        stats["cells"] = len(telemetry_index.rows)
+    return stats
+
 def load_safety_advice():
     global safety_advice_templates
     try:
@@ -145,7 +513,8 @@ def home():
         "models_loaded": bool(models),
         "available_endpoints": {
             "health_check": "/api/health (GET)",
-            "prediction": "/api/predict (POST)"
+            "prediction": "/api/predict (POST)",
+            "telemetry": "/api/telemetry (POST)"
         }
     })
 
@@ -168,6 +537,23 @@ def predict():
         response.headers.add('Access-Control-Allow-Methods', 'POST, OPTIONS')
         return response
 
+    # Shed load before doing any work once the in-flight limit is reached
+    degraded = admit_request()
+    if degraded is None:
+        print("Server overloaded, shedding request")
+        response = jsonify({"error": "Server overloaded, please retry later"})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(app.config['PREDICT_RETRY_AFTER'])
+        response.headers.add('Access-Control-Allow-Origin', request.headers.get('Origin', 'http://localhost:3002'))
+        response.headers.add('Access-Control-Allow-Credentials', 'true')
+        return response
+
+    try:
+        return predict_admitted(degraded)
+    finally:
+        release_request()
+
+def predict_admitted(degraded):
     try:
         # Check if models are loaded
         if not models:
@@ -234,6 +620,28 @@ def predict():
             print("Traceback:", traceback.format_exc())
             return jsonify({"error": f"Failed to make prediction: {str(e)}"}), 500
 
+        # Under load, skip insights and voice text and return only the essentials
+        if degraded:
+            print("\nDegraded mode: skipping insights and voice alert")
+            risk_level = get_risk_level(prediction)
+            probability = float(prediction * 100)
+            with load_lock:
+                load_stats["degraded"] += 1
+            response = jsonify({
+                "prediction": float(prediction),
+                "insights": {
+                    "risk_level": risk_level,
+                    "insights": [],
+                    "probability": probability
+                },
+                "risk_level": risk_level,
+                "probability": probability,
+                "degraded": True
+            })
+            response.headers.add('Access-Control-Allow-Origin', request.headers.get('Origin', 'http://localhost:3002'))
+            response.headers.add('Access-Control-Allow-Credentials', 'true')
+            return response
+
         # Generate insights with more detailed information
         print("\nGenerating insights...")
         insights_data = generate_insights(prediction, weather_data, traffic_data)
@@ -251,7 +659,8 @@ def predict():
             "insights": insights_data,
             "voice_alert": voice_alert,  # Now just a string
             "risk_level": insights_data.get('risk_level', 'UNKNOWN'),
-            "probability": insights_data.get('probability', 0.0)
+            "probability": insights_data.get('probability', 0.0),
+            "degraded": False
         }
         print("\nSending response:", response_data)
         
@@ -327,6 +736,13 @@ def generate_weather_data(lat, lon):
         print(f"Weather generation error: {e}")
         return get_default_weather_data()
 
+def get_congestion_level(congestion_percentage):
+    if congestion_percentage >= 70:
+        return "High"
+    elif congestion_percentage >= 40:
+        return "Moderate"
+    return "Low"
+
 def generate_traffic_data(lat, lon):
     try:
         # Use location coordinates to influence traffic patterns
@@ -349,18 +765,21 @@ def generate_traffic_data(lat, lon):
         congestion_base = urban_factor * 50  # Higher congestion in urban areas
         congestion_variation = 20.0 * math.sin(time_factor * 2 + location_factor)
         congestion_percentage = round(max(0, min(100, congestion_base + congestion_variation)), 1)
+
+        # Prefer live fleet telemetry when the cell has fresh readings, keeping
+        # the estimated congestion until the cell has a free-flow baseline
+        telemetry = get_telemetry_traffic(lat, lon)
+        if telemetry:
+            if telemetry["congestion_percentage"] is None:
+                telemetry["congestion_percentage"] = congestion_percentage
+            telemetry["congestion_level"] = get_congestion_level(telemetry["congestion_percentage"])
+            return telemetry
         
-        # Determine congestion level
-        congestion_level = "Low"
-        if congestion_percentage >= 70:
-            congestion_level = "High"
-        elif congestion_percentage >= 40:
-            congestion_level = "Moderate"
-            
         return {
             "flow_speed": flow_speed,
-            "congestion_level": congestion_level,
-            "congestion_percentage": congestion_percentage
+            "congestion_level": get_congestion_level(congestion_percentage),
+            "congestion_percentage": congestion_percentage,
+            "source": "estimated"
         }
     except Exception as e:
         print(f"Traffic generation error: {e}")
@@ -550,13 +969,16 @@ def get_safety_advice(conditions, risk_level):
         print(f"Error getting safety advice: {e}")
         return ["Unable to generate safety advice"]
 
+def get_risk_level(prediction):
+    if prediction >= 0.7:
+        return "HIGH"
+    elif prediction >= 0.4:
+        return "MEDIUM"
+    return "LOW"
+
 def generate_insights(prediction, weather_data, traffic_data):
     try:
-        risk_level = "LOW"
-        if prediction >= 0.7:
-            risk_level = "HIGH"
-        elif prediction >= 0.4:
-            risk_level = "MEDIUM"
+        risk_level = get_risk_level(prediction)
             
         # Get current conditions
         conditions = weather_data.get('conditions', 'Sunny')
@@ -638,6 +1060,67 @@ def generate_voice_alert(insights):
         print(f"Voice alert generation error: {e}")
         return "Unable to generate voice alert"
 
+@app.route('/api/telemetry', methods=['POST', 'OPTIONS'])
+def telemetry():
+    """Bulk ingest of fleet speed readings.
+
+    Accepts either {"readings": [{"latitude", "longitude", "speed"}, ...]}
+    or column arrays {"latitude": [...], "longitude": [...], "speed": [...]}.
+    Speeds are in km/h.
+    """
+    if request.method == 'OPTIONS':
+        response = jsonify({"status": "ok"})
+        response.headers.add('Access-Control-Allow-Origin', request.headers.get('Origin', 'http://localhost:3002'))
+        response.headers.add('Access-Control-Allow-Credentials', 'true')
+        response.headers.add('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+        response.headers.add('Access-Control-Allow-Methods', 'POST, OPTIONS')
+        return response
+
+    try:
+        try:
+            data = request.get_json(silent=True)
+        except RequestEntityTooLarge:
+            return jsonify({"error": f"Request body larger than {app.config['MAX_CONTENT_LENGTH']} bytes"}), 413
+        if not data:
+            return jsonify({"error": "No data received"}), 400
+        if not isinstance(data, dict):
+            return jsonify({"error": "Missing readings"}), 400
+
+        if 'readings' in data:
+            readings = data['readings']
+            if not isinstance(readings, list):
+                return jsonify({"error": "readings must be a list"}), 400
+            try:
+                lats = [r['latitude'] for r in readings]
+                lons = [r['longitude'] for r in readings]
+                speeds = [r['speed'] for r in readings]
+            except (KeyError, TypeError):
+                return jsonify({"error": "Each reading needs latitude, longitude and speed"}), 400
+        elif all(k in data for k in ('latitude', 'longitude', 'speed')):
+            lats, lons, speeds = data['latitude'], data['longitude'], data['speed']
+            if not all(isinstance(column, list) for column in (lats, lons, speeds)):
+                return jsonify({"error": "latitude, longitude and speed must be lists"}), 400
+        else:
+            return jsonify({"error": "Missing readings"}), 400
+
+        max_batch = app.config['TELEMETRY_MAX_BATCH']
+        if max(len(lats), len(lons), len(speeds)) > max_batch:
+            return jsonify({"error": f"Too many readings, at most {max_batch} per request"}), 413
+
+        try:
+            accepted, rejected = ingest_telemetry(lats, lons, speeds)
+        except (ValueError, TypeError) as e:
+            return jsonify({"error": f"Invalid readings: {str(e)}"}), 400
+
+        response = jsonify({"accepted": accepted, "rejected": rejected})
+        response.headers.add('Access-Control-Allow-Origin', request.headers.get('Origin', 'http://localhost:3002'))
+        response.headers.add('Access-Control-Allow-Credentials', 'true')
+        return response
+
+    except Exception as e:
+        print(f"\nERROR: Unexpected error in telemetry endpoint: {str(e)}")
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
 # Health check endpoint
 @app.route('/api/health', methods=['GET', 'OPTIONS'])
 def health_check():
@@ -659,7 +1142,9 @@ def health_check():
     response = jsonify({
         "status": "healthy" if models else "unhealthy",
         "models_loaded": bool(models),
-        "model_status": model_status
+        "model_status": model_status,
+        "load": get_load_stats(),
+        "telemetry": get_telemetry_stats()
     })
     response.headers.add('Access-Control-Allow-Origin', request.headers.get('Origin', 'http://localhost:3002'))
     response.headers.add('Access-Control-Allow-Credentials', 'true')
@@ -0,0 +1,163 @@
+"""Overload test for /api/predict admission control.
+
+Starts the backend on a local threaded server in a separate process and
+keeps FACTOR x PREDICT_MAX_IN_FLIGHT clients sending predictions at it, once
+with admission control effectively disabled and once with the configured
+limits. Shed clients wait for Retry-After before their next request.
+Reports latency percentiles plus the degraded and shed (503) rates.
+
+Run from the backend directory so the models load:
+
+    python load_test.py --factor 5 --requests 2000
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from werkzeug.serving import make_server
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q / 100.0 * len(values)))]
+
+
+def run_phase(url, concurrency, total_requests):
+    results = []
+    results_lock = threading.Lock()
+    remaining = [total_requests]
+
+    def client():
+        session = requests.Session()
+        while True:
+            with results_lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            payload = {"latitude": random.uniform(-60, 60), "longitude": random.uniform(-170, 170)}
+            start = time.perf_counter()
+            try:
+                response = session.post(url, json=payload, timeout=60)
+                status = response.status_code
+                degraded = status == 200 and response.json().get('degraded', False)
+            except requests.RequestException:
+                status, degraded = 0, False
+            elapsed = time.perf_counter() - start
+            with results_lock:
+                results.append((status, degraded, elapsed))
+            # Well-behaved clients back off when shed instead of retrying at once
+            if status == 503:
+                time.sleep(float(response.headers.get('Retry-After', 1)))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(client)
+    wall = time.perf_counter() - start
+
+    all_latency = [r[2] for r in results]
+    ok_latency = [r[2] for r in results if r[0] == 200]
+    return {
+        "requests": len(results),
+        "ok": len(ok_latency),
+        "degraded": sum(1 for r in results if r[1]),
+        "shed": sum(1 for r in results if r[0] == 503),
+        "errors": sum(1 for r in results if r[0] not in (200, 503)),
+        "throughput": len(results) / wall,
+        "p50_ms": percentile(all_latency, 50) * 1000,
+        "p99_ms": percentile(all_latency, 99) * 1000,
+        "ok_p50_ms": percentile(ok_latency, 50) * 1000,
+        "ok_p99_ms": percentile(ok_latency, 99) * 1000,
+    }
+
+
+def print_report(name, stats):
+    n = max(stats["requests"], 1)
+    print(
+        f"{name:<22} reqs={stats['requests']:<6} rps={stats['throughput']:7.1f} "
+        f"p50={stats['p50_ms']:7.1f}ms p99={stats['p99_ms']:7.1f}ms "
+        f"ok_p99={stats['ok_p99_ms']:7.1f}ms "
+        f"degraded={100.0 * stats['degraded'] / n:5.1f}% "
+        f"shed={100.0 * stats['shed'] / n:5.1f}% errors={stats['errors']}"
+    )
+
+
+def serve(port):
+    # The handlers log every request; keep that out of the report. stderr
+    # (sklearn warnings, werkzeug access log) is discarded by start_server
+    sys.stdout = open(os.devnull, 'w')
+    import app as backend
+    server = make_server('127.0.0.1', port, backend.app, threaded=True)
+    server.socket.listen(1024)
+    server.serve_forever()
+
+
+def start_server(port, max_in_flight, degrade_threshold):
+    env = dict(os.environ,
+               PREDICT_MAX_IN_FLIGHT=str(max_in_flight),
+               PREDICT_DEGRADE_THRESHOLD=str(degrade_threshold))
+    process = subprocess.Popen([sys.executable, __file__, '--serve', '--port', str(port)],
+                               env=env, stderr=subprocess.DEVNULL)
+    health_url = f"http://127.0.0.1:{port}/api/health"
+    deadline = time.time() + 300
+    while time.time() < deadline:
+        try:
+            if requests.get(health_url, timeout=1).json().get('models_loaded'):
+                return process
+        except requests.RequestException:
+            pass
+        if process.poll() is not None:
+            break
+        time.sleep(0.5)
+    process.kill()
+    sys.exit("Server failed to start with models loaded; run from the backend directory")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--factor', type=float, default=5.0,
+                        help="client concurrency as a multiple of --max-in-flight")
+    parser.add_argument('--requests', type=int, default=2000, help="requests per phase")
+    parser.add_argument('--max-in-flight', type=int,
+                        default=int(os.getenv('PREDICT_MAX_IN_FLIGHT', '4')))
+    parser.add_argument('--degrade-threshold', type=int,
+                        default=int(os.getenv('PREDICT_DEGRADE_THRESHOLD', '2')))
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port)
+        return
+
+    concurrency = int(args.factor * args.max_in_flight)
+    url = f"http://127.0.0.1:{args.port}/api/predict"
+    print(f"concurrency={concurrency} max_in_flight={args.max_in_flight} "
+          f"degrade_threshold={args.degrade_threshold} requests/phase={args.requests}")
+
+    phases = [
+        ("no admission control", 10 ** 9, 10 ** 9),
+        ("admission control", args.max_in_flight, args.degrade_threshold),
+    ]
+    for name, limit, threshold in phases:
+        process = start_server(args.port, limit, threshold)
+        try:
+            stats = run_phase(url, concurrency, args.requests)
+            load = requests.get(f"http://127.0.0.1:{args.port}/api/health").json()['load']
+        finally:
+            process.terminate()
+            process.wait()
+        print_report(name, stats)
+        print(f"  peak_in_flight={load['peak_in_flight']} shed={load['shed']} degraded={load['degraded']}")
+
+
+if __name__ == '__main__':
+    main()
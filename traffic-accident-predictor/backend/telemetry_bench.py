@@ -0,0 +1,110 @@
+"""Ingest benchmark for the fleet telemetry index.
+
+A synthetic replay generator drives a fleet of vehicles around a bounding
+box. Each vehicle wanders with a random heading and a speed that follows a
+bounded random walk. The readings are fed to ingest_telemetry in batches,
+once as numpy arrays and once as Python lists (what /api/telemetry passes
+after JSON parsing). Box sizes range from a single city, where many
+readings share a cell, to a region where almost every reading lands in its
+own cell.
+
+Run from the backend directory:
+
+    python telemetry_bench.py --readings 1000000
+"""
+import argparse
+import contextlib
+import os
+import time
+
+import numpy as np
+
+with contextlib.redirect_stdout(open(os.devnull, 'w')):
+    import app as backend
+
+SCENARIOS = [
+    ("city 0.1deg", 0.1),
+    ("metro 1deg", 1.0),
+    ("region 5deg", 5.0),
+]
+
+
+def replay(vehicles, batch_size, box, total, seed=0):
+    """Yield (lats, lons, speeds) batches from a simulated fleet."""
+    rng = np.random.default_rng(seed)
+    center_lat, center_lon = 12.97, 77.59
+    lats = center_lat + rng.uniform(-box / 2, box / 2, vehicles)
+    lons = center_lon + rng.uniform(-box / 2, box / 2, vehicles)
+    headings = rng.uniform(0, 2 * np.pi, vehicles)
+    speeds = rng.uniform(0, 100, vehicles)
+    interval = 1.0  # seconds between reports from one vehicle
+
+    cursor = 0
+    emitted = 0
+    while emitted < total:
+        n = min(batch_size, total - emitted)
+        idx = (cursor + np.arange(n)) % vehicles
+        cursor = (cursor + n) % vehicles
+
+        speeds[idx] = np.clip(speeds[idx] + rng.normal(0, 5, n), 0, 130)
+        headings[idx] += rng.normal(0, 0.2, n)
+        step = speeds[idx] * interval / 3600.0 / 111.0  # km/h -> degrees
+        lats[idx] = np.clip(lats[idx] + step * np.cos(headings[idx]),
+                            center_lat - box / 2, center_lat + box / 2)
+        lons[idx] = np.clip(lons[idx] + step * np.sin(headings[idx]),
+                            center_lon - box / 2, center_lon + box / 2)
+
+        yield lats[idx].copy(), lons[idx].copy(), speeds[idx].copy()
+        emitted += n
+
+
+def reset_index():
+    with backend.telemetry_lock:
+        backend.telemetry_index = backend.create_telemetry_index()
+
+
+def index_megabytes():
+    index = backend.telemetry_index
+    arrays = (index.row_cells, index.speeds, index.histogram, index.head,
+              index.count, index.total, index.last_update, index.first_seen, index.free_flow,
+              index.baseline_update)
+    return sum(a.nbytes for a in arrays) / 1e6
+
+
+def run(batches, as_lists):
+    reset_index()
+    if as_lists:
+        batches = [(la.tolist(), lo.tolist(), sp.tolist()) for la, lo, sp in batches]
+    readings = 0
+    slowest = 0.0
+    start = time.perf_counter()
+    for lats, lons, speeds in batches:
+        batch_start = time.perf_counter()
+        accepted, _ = backend.ingest_telemetry(lats, lons, speeds)
+        slowest = max(slowest, time.perf_counter() - batch_start)
+        readings += accepted
+    elapsed = time.perf_counter() - start
+    return readings / elapsed, slowest, backend.get_telemetry_stats()["cells"], index_megabytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--readings', type=int, default=1000000, help="readings per scenario")
+    parser.add_argument('--vehicles', type=int, default=100000)
+    parser.add_argument('--batch-size', type=int, default=backend.app.config['TELEMETRY_MAX_BATCH'])
+    args = parser.parse_args()
+
+    print(f"readings={args.readings} vehicles={args.vehicles} batch_size={args.batch_size} "
+          f"precision={backend.app.config['TELEMETRY_GEOHASH_PRECISION']} "
+          f"buffer_size={backend.app.config['TELEMETRY_BUFFER_SIZE']}")
+    for name, box in SCENARIOS:
+        batches = list(replay(args.vehicles, args.batch_size, box, args.readings))
+        array_rate, slowest, cells, megabytes = run(batches, as_lists=False)
+        list_rate, _, _, _ = run(batches, as_lists=True)
+        print(f"{name:<12} cells={cells:<7} index={megabytes:6.1f}MB "
+              f"arrays={array_rate / 1000:8.1f}k/s lists={list_rate / 1000:8.1f}k/s "
+              f"slowest_batch={slowest * 1000:5.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+"""Tests for the fleet telemetry index and /api/telemetry.
+
+The vectorised ring update in TelemetryIndex.ingest is checked against a
+per-cell deque model. Geohash cell ids are checked against a plain string
+encoder.
+
+Run from the backend directory:
+
+    python -m pytest -q test_telemetry.py
+"""
+import collections
+import contextlib
+import math
+import os
+
+import numpy as np
+import pytest
+
+with contextlib.redirect_stdout(open(os.devnull, 'w')):
+    import app as backend
+
+
+def reference_geohash(lat, lon, precision):
+    """Textbook geohash: bisect longitude and latitude alternately."""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    bits, bit_count, use_lon = 0, 0, True
+    while len(chars) < precision:
+        interval, value = (lon_range, lon) if use_lon else (lat_range, lat)
+        mid = (interval[0] + interval[1]) / 2
+        if value >= mid:
+            bits = bits * 2 + 1
+            interval[0] = mid
+        else:
+            bits = bits * 2
+            interval[1] = mid
+        use_lon = not use_lon
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(backend.GEOHASH_BASE32[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def encode(lat, lon, precision):
+    cell = int(backend.encode_geohash_cells(np.array([lat]), np.array([lon]), precision)[0])
+    return backend.geohash_from_cell(cell, precision)
+
+
+def new_index(size=8, max_age=100.0, min_samples=1, max_cells=10000,
+              half_life=3600.0, min_history=1800.0, capacity=4):
+    return backend.TelemetryIndex(size, max_age, min_samples, max_cells,
+                                  half_life, min_history, capacity=capacity)
+
+
+def reference_percentile(readings, q):
+    ordered = sorted(readings)
+    value = ordered[max(1, math.ceil(q / 100.0 * len(ordered))) - 1]
+    return min(int(value), backend.SPEED_BIN_COUNT - 1) + 0.5
+
+
+@pytest.mark.parametrize("lat, lon, expected", [
+    (57.64911, 10.40744, "u4pruydqqvj"),
+    (-25.382708, -49.265506, "6gkzwg"),
+    (42.6, -5.6, "ezs42"),
+])
+def test_geohash_known_vectors(lat, lon, expected):
+    assert encode(lat, lon, len(expected)) == expected
+
+
+def test_geohash_matches_reference_encoder():
+    rng = np.random.default_rng(7)
+    lats = rng.uniform(-90, 90, 500)
+    lons = rng.uniform(-180, 180, 500)
+    for precision in range(1, 13):
+        cells = backend.encode_geohash_cells(lats, lons, precision)
+        assert (cells >= 0).all()
+        for lat, lon, cell in zip(lats.tolist(), lons.tolist(), cells.tolist()):
+            assert backend.geohash_from_cell(cell, precision) == reference_geohash(lat, lon, precision)
+
+
+def test_geohash_edges_stay_in_range():
+    for lat, lon in [(90, 180), (-90, -180), (90, -180), (-90, 180), (0, 0)]:
+        assert encode(lat, lon, 12) == reference_geohash(lat, lon, 12)
+
+
+@pytest.mark.parametrize("size", [1, 3, 8])
+def test_ingest_matches_deque_model(size):
+    rng = np.random.default_rng(size)
+    max_age = 100.0
+    index = new_index(size=size, max_age=max_age)
+    model, last_seen = {}, {}
+    now = 1000.0
+    evicted_total = 0
+
+    for _ in range(1000):
+        now += rng.uniform(0, 15)
+        # Occasionally send more readings for one cell than its ring holds
+        n = int(rng.integers(0, 4 * size + 20))
+        cells = rng.integers(0, 60, n).astype(np.int64) * 7919
+        speeds = np.minimum(rng.uniform(0, 300, n), backend.MAX_TELEMETRY_SPEED)
+
+        evicted = index.ingest(cells, speeds.copy(), now)
+        evicted_total += evicted
+        if index.last_sweep == now:
+            stale = [cell for cell in model if now - last_seen[cell] > max_age]
+            assert evicted == len(stale)
+            for cell in stale:
+                del model[cell]
+        for cell, speed in zip(cells.tolist(), speeds.astype(np.float32).tolist()):
+            model.setdefault(cell, collections.deque(maxlen=size)).append(speed)
+            last_seen[cell] = now
+
+        assert set(index.rows) == set(model)
+        for cell, readings in model.items():
+            row = index.rows[cell]
+            assert index.row_cells[row] == cell
+            assert index.count[row] == len(readings)
+            assert index.total[row] == pytest.approx(sum(readings), abs=1e-6)
+            expected = np.bincount(np.minimum(np.array(readings), backend.SPEED_BIN_COUNT - 1).astype(int),
+                                   minlength=backend.SPEED_BIN_COUNT)
+            assert (index.histogram[row] == expected).all()
+            assert index.percentile(row, 85) == reference_percentile(readings, 85)
+
+    assert evicted_total > 0
+
+
+def test_oversized_batch_keeps_latest_readings():
+    index = new_index(size=4)
+    index.ingest(np.full(10, 5, dtype=np.int64), np.arange(10, dtype=float), 0.0)
+    row = index.rows[5]
+    assert index.count[row] == 4
+    assert index.total[row] == 6 + 7 + 8 + 9
+
+
+def test_max_cells_evicts_least_recently_updated():
+    index = new_index(max_cells=3, capacity=2)
+    for t, cell in enumerate([1, 2, 3, 1]):
+        index.ingest(np.array([cell]), np.array([10.0]), float(t))
+    assert index.ingest(np.array([4]), np.array([10.0]), 4.0) == 1
+    assert sorted(index.rows) == [1, 3, 4]
+    # Cells in the batch itself are never evicted to make room
+    assert index.ingest(np.array([5, 6, 1]), np.array([1.0, 2.0, 3.0]), 5.0) == 2
+    assert sorted(index.rows) == [1, 5, 6]
+    assert index.capacity == 3
+    with pytest.raises(ValueError):
+        index.ingest(np.array([7, 8, 9, 10]), np.ones(4), 6.0)
+
+
+def test_free_flow_baseline_survives_a_jam():
+    index = new_index(size=256, min_samples=5, max_age=300.0)
+    cell = np.zeros(50, dtype=np.int64)
+    assert index.ingest(cell, np.full(50, 8.0), 0.0) == 0
+    # Not enough history yet to judge congestion
+    assert index.lookup(0, 0.0)[1] is None
+
+    rng = np.random.default_rng(0)
+    for minute in range(40):
+        index.ingest(cell, rng.normal(60, 5, 50), minute * 60.0)
+    for minute in range(40, 70):
+        index.ingest(cell, np.full(50, 8.0), minute * 60.0)
+    mean, free_flow, _ = index.lookup(0, 69 * 60.0)
+    assert mean == pytest.approx(8.0)
+    assert free_flow > 40.0
+
+
+@pytest.fixture
+def client():
+    backend.telemetry_index = backend.create_telemetry_index()
+    return backend.app.test_client()
+
+
+@pytest.mark.parametrize("body", ["5", "true", "[1, 2]", "\"x\"", "{}"])
+def test_telemetry_rejects_non_object_bodies(client, body):
+    response = client.post('/api/telemetry', data=body, content_type='application/json')
+    assert response.status_code == 400
+
+
+def test_telemetry_rejects_too_many_readings(client):
+    n = backend.app.config['TELEMETRY_MAX_BATCH'] + 1
+    response = client.post('/api/telemetry', json={"latitude": [1.0] * n, "longitude": [1.0] * n,
+                                                    "speed": [1.0] * n})
+    assert response.status_code == 413
+
+
+def test_telemetry_ingest_feeds_traffic_features(client):
+    response = client.post('/api/telemetry', json={"readings": [
+        {"latitude": 12.9, "longitude": 77.6, "speed": speed} for speed in [30, 40, 50, 60, 300, -1]
+    ]})
+    assert response.get_json() == {"accepted": 5, "rejected": 1}
+    traffic = backend.get_telemetry_traffic(12.9, 77.6)
+    assert traffic["sample_count"] == 5
+    assert traffic["flow_speed"] == pytest.approx((30 + 40 + 50 + 60 + 250) / 5)
+    assert traffic["congestion_percentage"] is None